@@ -17,8 +17,10 @@ their own models.
 from __future__ import annotations
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Tuple, List
+from functools import partial
+from typing import Dict, Iterable, Tuple, List, Optional, Union
 
 # Ensure local imports work when executed outside of a package context
 import sys as _sys
@@ -27,12 +29,41 @@ _current_dir = _os.path.dirname(_os.path.abspath(__file__))
 if _current_dir not in _sys.path:
     _sys.path.insert(0, _current_dir)
 
-from pdf_processor import parse_pdf  # type: ignore
-from persona_matcher import rank_sections  # type: ignore
-from document_intelligence import refine_subsections  # type: ignore
-
-
-def detect_persona_and_job(full_text: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+from utils import write_json  # type: ignore
+
+# Persona heuristics in priority order: the first rule with any keyword present
+# anywhere in the text determines the persona role and job task.  Note that
+# this is not the rule of the earliest keyword in the text, so a single
+# alternation regex with ``match.lastgroup`` dispatch would change results.
+_PERSONA_RULES: List[Tuple[Tuple[str, ...], str, str]] = [
+    (
+        ("research", "literature"),
+        "Researcher",
+        "Prepare a literature review of the document’s contributions",
+    ),
+    (
+        ("student", "exam", "undergraduate"),
+        "Student",
+        "Identify and study the key concepts for exam preparation",
+    ),
+    (
+        ("analysis", "analyst", "financial"),
+        "Business Analyst",
+        "Extract insights and analyse trends from the document",
+    ),
+    (
+        ("patient", "medical", "nursing"),
+        "Healthcare Professional",
+        "Summarise clinical information relevant to patient care",
+    ),
+]
+_DEFAULT_ROLE = "Reader"
+_DEFAULT_TASK = "Summarise the key sections of the document"
+
+
+def detect_persona_and_job(
+    texts: Union[str, Iterable[str]]
+) -> Tuple[Dict[str, str], Dict[str, str]]:
     """Infer a persona and job description from raw text.
 
     This function uses simple keyword‑matching heuristics to guess the
@@ -41,30 +72,34 @@ def detect_persona_and_job(full_text: str) -> Tuple[Dict[str, str], Dict[str, st
     default persona of ``Reader`` with a generic summarisation task is
     returned.
 
+    The text may be supplied in chunks (for example one per section) so that
+    the whole document never has to be concatenated; scanning stops as soon
+    as a keyword of the highest‑priority rule has been seen.
+
     Args:
-        full_text: Concatenated text of all sections extracted from a PDF.
+        texts: Text extracted from a PDF, either as a single string or as an
+            iterable of chunks such as the text of each section.
 
     Returns:
         A tuple containing the persona dictionary (with a ``role`` key) and
         the job dictionary (with a ``task`` key).
     """
-    lower = full_text.lower()
-    # Default values
-    role = "Reader"
-    task = "Summarise the key sections of the document"
-    # Heuristic checks for more specific roles and tasks
-    if "research" in lower or "literature" in lower:
-        role = "Researcher"
-        task = "Prepare a literature review of the document’s contributions"
-    elif "student" in lower or "exam" in lower or "undergraduate" in lower:
-        role = "Student"
-        task = "Identify and study the key concepts for exam preparation"
-    elif "analysis" in lower or "analyst" in lower or "financial" in lower:
-        role = "Business Analyst"
-        task = "Extract insights and analyse trends from the document"
-    elif "patient" in lower or "medical" in lower or "nursing" in lower:
-        role = "Healthcare Professional"
-        task = "Summarise clinical information relevant to patient care"
+    if isinstance(texts, str):
+        texts = (texts,)
+    # Index of the best matching rule so far; len(_PERSONA_RULES) means none
+    best = len(_PERSONA_RULES)
+    for chunk in texts:
+        lower = chunk.lower()
+        # Only rules that outrank the current match need to be checked
+        for idx in range(best):
+            if any(keyword in lower for keyword in _PERSONA_RULES[idx][0]):
+                best = idx
+                break
+        if best == 0:
+            break
+    if best == len(_PERSONA_RULES):
+        return {"role": _DEFAULT_ROLE}, {"task": _DEFAULT_TASK}
+    _, role, task = _PERSONA_RULES[best]
     return {"role": role}, {"task": task}
 
 
@@ -80,26 +115,28 @@ def process_pdf(pdf_path: str, output_dir: str) -> None:
         pdf_path: Absolute path to the PDF file.
         output_dir: Directory where the output JSON should be written.
     """
-    # Extract sections and assign document names
-    sections = parse_pdf(pdf_path)
-    # Combine all text to detect persona and job
-    full_text = " ".join([sec.get("text", "") for sec in sections])
-    persona, job = detect_persona_and_job(full_text)
-    # Annotate each section with the document name
+    # The processing pipeline is imported on first use so that importing this
+    # module (e.g. only for ``detect_persona_and_job``) stays cheap
+    from pdf_processor import parse_pdf  # type: ignore
+    from persona_matcher import rank_sections  # type: ignore
+    from document_intelligence import refine_subsections  # type: ignore
+
+    # Extract sections tagged with the document name
     base_name = os.path.basename(pdf_path)
-    for sec in sections:
-        sec["document"] = base_name
+    sections = parse_pdf(pdf_path, document=base_name)
+    # Detect persona and job section by section
+    persona, job = detect_persona_and_job(sec.text for sec in sections)
     # Rank sections and select top 5
-    ranked = rank_sections(sections, persona, job)
+    ranked = rank_sections(sections, persona, job, copy=False)
     top_n = min(5, len(ranked))
     top_sections = ranked[:top_n]
     # Prepare extracted sections output
     extracted = [
         {
-            "document": sec.get("document"),
-            "section_title": sec.get("section_title"),
-            "importance_rank": sec.get("importance_rank"),
-            "page_number": sec.get("page_number"),
+            "document": sec.document,
+            "section_title": sec.section_title,
+            "importance_rank": sec.importance_rank,
+            "page_number": sec.page_number,
         }
         for sec in top_sections
     ]
@@ -122,30 +159,45 @@ def process_pdf(pdf_path: str, output_dir: str) -> None:
     # Determine output file name
     output_filename = os.path.splitext(base_name)[0] + "_output.json"
     output_path = os.path.join(output_dir, output_filename)
-    with open(output_path, "w", encoding="utf-8") as f:
-        import json
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    write_json(output_path, output_data)
     print(f"Processed {pdf_path} -> {output_path}")
 
 
-def process_directory(pdf_dir: str, output_dir: str) -> None:
+def _process_pdf_safe(pdf_path: str, output_dir: str) -> None:
+    """Run ``process_pdf`` and report, rather than raise, any failure."""
+    try:
+        process_pdf(pdf_path, output_dir)
+    except Exception as exc:
+        print(f"Error processing {pdf_path}: {exc}")
+
+
+def process_directory(pdf_dir: str, output_dir: str, workers: Optional[int] = None) -> None:
     """Process all PDFs in a directory.
 
     Iterates over every file in ``pdf_dir`` with a ``.pdf`` extension and
     processes each via ``process_pdf``.  Non‑PDF files are ignored.  Output
-    JSON files are written to ``output_dir``.
+    JSON files are written to ``output_dir``.  PDFs are independent of each
+    other, so when there is more than one they are processed in parallel
+    across worker processes.
 
     Args:
         pdf_dir: Directory containing PDF files.
         output_dir: Target directory for JSON summaries.
+        workers: Maximum number of worker processes.  Defaults to the number
+            of CPUs; ``1`` processes the PDFs sequentially.
     """
-    for entry in os.listdir(pdf_dir):
-        if entry.lower().endswith(".pdf"):
-            pdf_path = os.path.join(pdf_dir, entry)
-            try:
-                process_pdf(pdf_path, output_dir)
-            except Exception as exc:
-                print(f"Error processing {pdf_path}: {exc}")
+    pdf_paths = [
+        os.path.join(pdf_dir, entry)
+        for entry in os.listdir(pdf_dir)
+        if entry.lower().endswith(".pdf")
+    ]
+    worker = partial(_process_pdf_safe, output_dir=output_dir)
+    if len(pdf_paths) <= 1 or workers == 1:
+        for pdf_path in pdf_paths:
+            worker(pdf_path)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(worker, pdf_paths))
 
 
 if __name__ == "__main__":
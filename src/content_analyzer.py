@@ -9,11 +9,23 @@ adjusted via constants at the top of the file.
 
 from __future__ import annotations
 
-from typing import List, Dict, Tuple, Iterable
+from typing import TYPE_CHECKING, List, Dict, Tuple, Iterable
 import re
 import math
 from collections import Counter
 
+# When executed without package context, modify sys.path so local modules are importable.
+if __package__ is None or __package__ == "":
+    import os as _os, sys as _sys
+    _current_dir = _os.path.dirname(_os.path.abspath(__file__))
+    if _current_dir not in _sys.path:
+        _sys.path.insert(0, _current_dir)
+
+from utils import clean_text  # type: ignore
+
+if TYPE_CHECKING:
+    from pdf_processor import Section  # type: ignore
+
 # Weight constants for the relevance score
 WEIGHT_SEMANTIC = 0.40
 WEIGHT_PERSONA = 0.25
@@ -28,98 +40,111 @@ ACTION_VERBS = {
     "predict", "plan", "execute", "monitor", "measure"
 }
 
+# A single token in lower‑cased text
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 
 def _clean_text(text: str) -> str:
     """Lowercase and remove non‑alphanumeric characters for simple matching."""
-    return re.sub(r"[^a-zA-Z0-9\s]", " ", text.lower())
+    return clean_text(text)
 
 
-def _tokenize(text: str) -> List[str]:
-    """Tokenize and normalise a piece of text into lower‑cased words without punctuation."""
-    return re.sub(r"[^a-zA-Z0-9\s]", " ", text.lower()).split()
+def _count_tokens(text: str) -> Counter:
+    """Count the lower‑cased words of a piece of text, ignoring punctuation."""
+    return Counter(_TOKEN_RE.findall(text.lower()))
 
 
-def _compute_tf(words: List[str]) -> Dict[str, float]:
-    """Compute term frequency for a list of words."""
-    if not words:
-        return {}
-    counts = Counter(words)
-    total = len(words)
-    return {w: c / total for w, c in counts.items()}
+def _prepare(sections: List[Section]) -> Tuple[List[Counter], List[int], Counter]:
+    """Tokenise every section once for reuse across the scoring components.
 
+    Returns:
+        A tuple of the word counts and the total number of words for each
+        section, and the number of sections each word occurs in.
+    """
+    counts_list: List[Counter] = []
+    total_counts: List[int] = []
+    doc_freqs: Counter = Counter()
+    for sec in sections:
+        words = _TOKEN_RE.findall(sec.text.lower())
+        counts = Counter(words)
+        counts_list.append(counts)
+        # Total number of words in the section
+        total_counts.append(len(words))
+        doc_freqs.update(counts.keys())
+    return counts_list, total_counts, doc_freqs
 
-def _compute_idf(doc_tokens: List[List[str]]) -> Dict[str, float]:
-    """Compute inverse document frequency for a list of documents (token lists)."""
+
+def _compute_idf(doc_freqs: Dict[str, int], total_docs: int) -> Dict[str, float]:
+    """Compute inverse document frequency from per‑term document counts."""
     idf: Dict[str, float] = {}
-    total_docs = len(doc_tokens)
-    # Count documents containing each term
-    doc_counts: Dict[str, int] = {}
-    for tokens in doc_tokens:
-        seen = set(tokens)
-        for token in seen:
-            doc_counts[token] = doc_counts.get(token, 0) + 1
-    for token, doc_count in doc_counts.items():
+    for token, doc_count in doc_freqs.items():
         # Add 1 to numerator and denominator to avoid division by zero
         idf[token] = math.log((1 + total_docs) / (1 + doc_count)) + 1.0
     return idf
 
 
-def _compute_tfidf_vector(tf: Dict[str, float], idf: Dict[str, float]) -> Dict[str, float]:
-    """Compute a TF‑IDF vector from term frequency and IDF dictionaries."""
-    return {word: tf_val * idf.get(word, 0.0) for word, tf_val in tf.items()}
-
-
-def _cosine_similarity(vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
-    """Compute cosine similarity between two sparse vectors represented as dicts."""
-    if not vec1 or not vec2:
-        return 0.0
-    # Compute dot product
-    dot = 0.0
-    # Iterate over smaller vector for efficiency
-    if len(vec1) < len(vec2):
-        for word, val in vec1.items():
-            dot += val * vec2.get(word, 0.0)
-    else:
-        for word, val in vec2.items():
-            dot += val * vec1.get(word, 0.0)
-    # Compute norms
-    norm1 = math.sqrt(sum(v * v for v in vec1.values()))
-    norm2 = math.sqrt(sum(v * v for v in vec2.values()))
-    if norm1 == 0.0 or norm2 == 0.0:
-        return 0.0
-    return dot / (norm1 * norm2)
-
-
-def compute_semantic_similarity(sections: List[Dict[str, object]], query: str) -> List[float]:
+def _l2_norm(values: Iterable[float]) -> float:
+    """Return the Euclidean norm of a sequence of vector components.
+
+    ``math.hypot`` avoids overflow and rounding errors of ``sqrt(sum(v * v))``.
+    """
+    return math.hypot(*values)
+
+
+def compute_semantic_similarity(sections: List[Section], query: str) -> List[float]:
     """Compute cosine similarity between each section and the query using TF‑IDF.
 
     This implementation avoids external libraries by computing TF‑IDF vectors
-    manually.  It uses simple tokenization and sparse vector representations.
+    manually.  IDF is computed over the query and all sections together
+    (smoothed, as in scikit‑learn's ``TfidfVectorizer``), and each similarity
+    is a sparse dot product over the query's terms divided by the norms.
 
     Args:
-        sections: List of section dictionaries with a ``text`` field.
+        sections: List of sections.
         query: A combined persona/job description string.
 
     Returns:
         A list of similarity scores corresponding to each section.
     """
-    # Build tokenised documents for query and sections
-    section_tokens = [_tokenize(sec.get("text", "")) for sec in sections]
-    query_tokens = _tokenize(query)
-    # Compute IDF across all documents (query + sections)
-    idf = _compute_idf([query_tokens] + section_tokens)
-    # Compute TF-IDF vectors
-    query_tf = _compute_tf(query_tokens)
-    query_vec = _compute_tfidf_vector(query_tf, idf)
+    counts_list, _, doc_freqs = _prepare(sections)
+    return _semantic_similarity_from_tokens(counts_list, doc_freqs, query)
+
+
+def _semantic_similarity_from_tokens(
+    counts_list: List[Counter], doc_freqs: Counter, query: str
+) -> List[float]:
+    """Compute query similarity for sections that have already been tokenised.
+
+    Only terms shared with the query contribute to the dot product, so this
+    computes the sparse product of the section matrix with the query vector
+    column by column and never materialises normalised section vectors.
+    ``doc_freqs`` holds the section document frequencies from ``_prepare``;
+    the query is counted as one more document on top of them.
+    """
+    query_counts = _count_tokens(query)
+    total_docs = len(counts_list) + 1
+    idf = _compute_idf(doc_freqs, total_docs)
+    # Account for the query itself as a document
+    idf.update(_compute_idf({word: doc_freqs[word] + 1 for word in query_counts}, total_docs))
+    query_vec = {word: count * idf[word] for word, count in query_counts.items()}
+    query_norm = _l2_norm(query_vec.values())
     sims: List[float] = []
-    for tokens in section_tokens:
-        tf = _compute_tf(tokens)
-        vec = _compute_tfidf_vector(tf, idf)
-        sims.append(_cosine_similarity(vec, query_vec))
+    for counts in counts_list:
+        # Sections sharing no term with the query (including empty ones) score zero
+        if query_norm == 0.0 or counts.keys().isdisjoint(query_vec):
+            sims.append(0.0)
+            continue
+        dot = 0.0
+        for word, query_val in query_vec.items():
+            count = counts.get(word)
+            if count:
+                dot += query_val * (count * idf[word])
+        norm = _l2_norm([count * idf[word] for word, count in counts.items()])
+        sims.append(dot / (query_norm * norm))
     return sims
 
 
-def compute_persona_match(sections: List[Dict[str, object]], persona_role: str) -> List[float]:
+def compute_persona_match(sections: List[Section], persona_role: str) -> List[float]:
     """Compute persona word overlap scores for each section.
 
     The score is the fraction of unique words from the persona role that
@@ -127,48 +152,59 @@ def compute_persona_match(sections: List[Dict[str, object]], persona_role: str)
     punctuation for comparison.
 
     Args:
-        sections: List of section dictionaries with a ``text`` field.
+        sections: List of sections.
         persona_role: The persona role string (e.g. "PhD Researcher in Computational Biology").
 
     Returns:
         A list of scores in [0, 1].
     """
+    counts_list, _, _ = _prepare(sections)
+    return _persona_match_from_tokens(counts_list, persona_role)
+
+
+def _persona_match_from_tokens(counts_list: List[Counter], persona_role: str) -> List[float]:
+    """Compute persona overlap for sections given their word counts."""
     persona_words = set(_clean_text(persona_role).split())
     scores: List[float] = []
-    for sec in sections:
-        sec_words = set(_clean_text(sec.get("text", "")).split())
-        if not persona_words or not sec_words:
+    for counts in counts_list:
+        if not persona_words or not counts:
             scores.append(0.0)
         else:
-            overlap = persona_words.intersection(sec_words)
+            overlap = persona_words & counts.keys()
             scores.append(len(overlap) / len(persona_words))
     return scores
 
 
-def compute_actionability(sections: List[Dict[str, object]]) -> List[float]:
+def compute_actionability(sections: List[Section]) -> List[float]:
     """Estimate the actionability of each section based on action verbs.
 
     The score is the ratio of action verbs to total words in the section.  Only
     exact, lower‑cased matches from the ACTION_VERBS set are counted.
 
     Args:
-        sections: List of section dictionaries with a ``text`` field.
+        sections: List of sections.
 
     Returns:
         A list of scores in [0, 1].
     """
+    counts_list, total_counts, _ = _prepare(sections)
+    return _actionability_from_tokens(counts_list, total_counts)
+
+
+def _actionability_from_tokens(counts_list: List[Counter], total_counts: List[int]) -> List[float]:
+    """Compute actionability for sections given their word counts and lengths."""
     scores: List[float] = []
-    for sec in sections:
-        words = _clean_text(sec.get("text", "")).split()
-        if not words:
+    for counts, total in zip(counts_list, total_counts):
+        if not total:
             scores.append(0.0)
             continue
-        action_count = sum(1 for w in words if w in ACTION_VERBS)
-        scores.append(action_count / len(words))
+        # Total occurrences of action verbs in the section
+        action_count = sum(map(counts.__getitem__, ACTION_VERBS & counts.keys()))
+        scores.append(action_count / total)
     return scores
 
 
-def compute_cross_document_importance(sections: List[Dict[str, object]]) -> List[float]:
+def compute_cross_document_importance(sections: List[Section]) -> List[float]:
     """Compute a cross‑document importance score based on repeated section titles.
 
     Sections with titles that occur in multiple documents are given a higher
@@ -176,36 +212,48 @@ def compute_cross_document_importance(sections: List[Dict[str, object]]) -> List
     observed among titles.
 
     Args:
-        sections: List of section dictionaries with ``section_title`` and ``document`` fields.
+        sections: List of sections.
 
     Returns:
         A list of scores in [0, 1].
     """
-    # Count occurrences of each title across documents
-    title_counts: Dict[str, set] = {}
-    for sec in sections:
-        title = sec.get("section_title", "")
-        doc = sec.get("document", "")
-        title_counts.setdefault(title, set()).add(doc)
-    freq_map = {title: len(docs) for title, docs in title_counts.items()}
-    max_freq = max(freq_map.values()) if freq_map else 1
-    scores: List[float] = []
+    # Count the distinct documents each title occurs in
+    seen = set()
+    title_counts: Counter = Counter()
     for sec in sections:
-        title = sec.get("section_title", "")
-        freq = freq_map.get(title, 1)
-        scores.append(freq / max_freq)
-    return scores
+        title = sec.section_title
+        key = (title, sec.document)
+        if key not in seen:
+            seen.add(key)
+            title_counts[title] += 1
+    max_freq = max(title_counts.values(), default=1)
+    return [title_counts[sec.section_title] / max_freq for sec in sections]
+
+
+def _min_span(values: List[float]) -> Tuple[float, float]:
+    """Return the minimum and range of ``values`` for min‑max normalisation.
+
+    A constant (or empty) component gets a range of 1.0 so that every value
+    normalises to 0.0 without a separate branch per element.
+    """
+    if not values:
+        return 0.0, 1.0
+    min_val = min(values)
+    max_val = max(values)
+    if max_val == min_val:
+        return min_val, 1.0
+    return min_val, max_val - min_val
 
 
 def compute_relevance_scores(
-    sections: List[Dict[str, object]],
+    sections: List[Section],
     persona: Dict[str, str],
     job: Dict[str, str],
 ) -> List[float]:
     """Compute the overall relevance score for each section.
 
     Args:
-        sections: List of section dictionaries.
+        sections: List of sections.
         persona: Dictionary with at least a ``role`` key and optionally a ``description``.
         job: Dictionary with a ``task`` key describing the job to be done.
 
@@ -217,36 +265,28 @@ def compute_relevance_scores(
     persona_desc = persona.get("description", "")
     job_task = job.get("task", "")
     query = f"{persona_role} {persona_desc} {job_task}".strip()
+    # Tokenise each section once and share the result between components
+    counts_list, total_counts, doc_freqs = _prepare(sections)
     # Compute individual components
-    semantic = compute_semantic_similarity(sections, query)
-    persona_match_scores = compute_persona_match(sections, persona_role + " " + persona_desc)
-    actionability_scores = compute_actionability(sections)
+    semantic = _semantic_similarity_from_tokens(counts_list, doc_freqs, query)
+    persona_match_scores = _persona_match_from_tokens(counts_list, persona_role + " " + persona_desc)
+    actionability_scores = _actionability_from_tokens(counts_list, total_counts)
     cross_doc_scores = compute_cross_document_importance(sections)
-    # Normalise each component to [0, 1]
-    def normalise(arr: List[float]) -> List[float]:
-        if not arr:
-            return arr
-        max_val = max(arr)
-        min_val = min(arr)
-        if max_val == min_val:
-            return [0.0 for _ in arr]
-        return [(x - min_val) / (max_val - min_val) for x in arr]
-
-    sem_norm = normalise(semantic)
-    pers_norm = normalise(persona_match_scores)
-    act_norm = normalise(actionability_scores)
-    cross_norm = normalise(cross_doc_scores)
-    # Weighted sum
-    scores: List[float] = []
-    for i in range(len(sections)):
-        score = (
-            WEIGHT_SEMANTIC * sem_norm[i]
-            + WEIGHT_PERSONA * pers_norm[i]
-            + WEIGHT_ACTION * act_norm[i]
-            + WEIGHT_CROSS_DOC * cross_norm[i]
+    # Normalise each component to [0, 1] and take the weighted sum in a single
+    # pass over the sections
+    s_min, s_span = _min_span(semantic)
+    p_min, p_span = _min_span(persona_match_scores)
+    a_min, a_span = _min_span(actionability_scores)
+    c_min, c_span = _min_span(cross_doc_scores)
+    return [
+        WEIGHT_SEMANTIC * ((s - s_min) / s_span)
+        + WEIGHT_PERSONA * ((p - p_min) / p_span)
+        + WEIGHT_ACTION * ((a - a_min) / a_span)
+        + WEIGHT_CROSS_DOC * ((c - c_min) / c_span)
+        for s, p, a, c in zip(
+            semantic, persona_match_scores, actionability_scores, cross_doc_scores
         )
-        scores.append(score)
-    return scores
+    ]
 
 
 __all__ = [
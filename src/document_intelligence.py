@@ -9,8 +9,24 @@ preserving key information.
 
 from __future__ import annotations
 
+import heapq
 import re
-from typing import List, Dict, Tuple
+from typing import TYPE_CHECKING, List, Dict, Tuple
+
+# When executed without package context, modify sys.path so local modules are importable.
+if __package__ is None or __package__ == "":
+    import os as _os, sys as _sys
+    _current_dir = _os.path.dirname(_os.path.abspath(__file__))
+    if _current_dir not in _sys.path:
+        _sys.path.insert(0, _current_dir)
+
+from utils import clean_text  # type: ignore
+
+if TYPE_CHECKING:
+    from pdf_processor import Section  # type: ignore
+
+# Sentence boundaries: whitespace following a period, exclamation or question mark
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
 
 
 def _split_into_sentences(text: str) -> List[str]:
@@ -23,9 +39,9 @@ def _split_into_sentences(text: str) -> List[str]:
         A list of sentences.  Sentences shorter than 20 characters are filtered out.
     """
     # Basic sentence splitter on period, exclamation or question mark
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    # Trim and filter very short sentences
-    sentences = [p.strip() for p in parts if len(p.strip()) > 20]
+    parts = _SENT_SPLIT.split(text)
+    # Trim (once per fragment) and filter very short sentences
+    sentences = [p for p in map(str.strip, parts) if len(p) > 20]
     return sentences
 
 
@@ -36,15 +52,14 @@ def _score_sentence(sentence: str, query_terms: set) -> float:
     the total number of unique words in the sentence.  Terms are compared
     case‑insensitively after removing punctuation.
     """
-    words = re.sub(r"[^a-zA-Z0-9\s]", " ", sentence.lower()).split()
-    if not words:
+    unique_words = set(clean_text(sentence).split())
+    if not unique_words:
         return 0.0
-    overlap = query_terms.intersection(words)
-    return len(overlap) / len(set(words))
+    return len(query_terms & unique_words) / len(unique_words)
 
 
 def refine_subsections(
-    ranked_sections: List[Dict[str, object]],
+    ranked_sections: List[Section],
     persona: Dict[str, str],
     job: Dict[str, str],
     top_n: int = 5,
@@ -52,8 +67,8 @@ def refine_subsections(
     """Generate refined summaries for the top ranked sections.
 
     Args:
-        ranked_sections: Sections sorted by importance.  Must contain at least
-            ``text``, ``document`` and ``page_number``.
+        ranked_sections: Sections sorted by importance.  Must have at least
+            ``text``, ``document`` and ``page_number`` set.
         persona: Persona definition with ``role`` and optional ``description``.
         job: Job‑to‑be‑done definition with ``task``.
         top_n: Number of sections to summarise.  Defaults to 5.
@@ -66,28 +81,26 @@ def refine_subsections(
     # Build a set of query terms from persona and job description
     query = f"{persona.get('role', '')} {persona.get('description', '')} {job.get('task', '')}"
     # Lowercase and strip punctuation
-    query_terms = set(
-        re.sub(r"[^a-zA-Z0-9\s]", " ", query.lower()).split()
-    )
+    query_terms = set(clean_text(query).split())
     # Limit to top N sections
     for section in ranked_sections[:top_n]:
-        text = section.get("text", "")
+        text = section.text
         sentences = _split_into_sentences(text)
         if not sentences:
             refined = text.strip()[:300]
         else:
-            # Score each sentence and select top two
+            # Score each sentence and select top two; nlargest keeps the
+            # original order for ties, like a stable descending sort
             scored: List[Tuple[str, float]] = [
                 (sent, _score_sentence(sent, query_terms)) for sent in sentences
             ]
-            scored.sort(key=lambda x: x[1], reverse=True)
-            top_sents = [s for s, _ in scored[:2]]
+            top_sents = [s for s, _ in heapq.nlargest(2, scored, key=lambda x: x[1])]
             refined = " " .join(top_sents).strip()
         results.append(
             {
-                "document": section.get("document"),
+                "document": section.document,
                 "refined_text": refined,
-                "page_number": section.get("page_number"),
+                "page_number": section.page_number,
             }
         )
     return results
@@ -11,8 +11,10 @@ from __future__ import annotations
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from functools import partial
+from typing import Dict, List, Optional
 
 # When the script is executed directly (without using -m), the package context
 # may not be set, leading to relative import failures.  Append the directory
@@ -23,9 +25,7 @@ if __package__ is None or __package__ == "":
     if _current_dir not in _sys.path:
         _sys.path.insert(0, _current_dir)
 
-from pdf_processor import parse_pdf  # type: ignore
-from persona_matcher import rank_sections  # type: ignore
-from document_intelligence import refine_subsections  # type: ignore
+from utils import write_json  # type: ignore
 
 # Optional automatic persona detection.  If persona and job information
 # are missing from the input JSON, we attempt to infer them from the
@@ -38,14 +38,24 @@ except Exception:
     detect_persona_and_job = None  # type: ignore
 
 
-def process_input_file(input_path: str, input_dir: str, output_dir: str) -> None:
+def process_input_file(
+    input_path: str, input_dir: str, output_dir: str, workers: Optional[int] = None
+) -> None:
     """Process a single input JSON and write an output JSON.
 
     Args:
         input_path: Absolute path to the input JSON file.
         input_dir: Directory containing the input file and referenced PDFs.
         output_dir: Directory where the output JSON should be written.
+        workers: Maximum number of processes to parse the referenced PDFs
+            with.  Defaults to the number of CPUs.
     """
+    # The processing pipeline is imported on first use so that worker
+    # processes and callers that only need part of this module start faster
+    from pdf_processor import Section, parse_pdfs  # type: ignore
+    from persona_matcher import rank_sections  # type: ignore
+    from document_intelligence import refine_subsections  # type: ignore
+
     with open(input_path, "r", encoding="utf-8") as f:
         try:
             input_data = json.load(f)
@@ -59,35 +69,26 @@ def process_input_file(input_path: str, input_dir: str, output_dir: str) -> None
     if not docs_info:
         print(f"Skipping {input_path}: no documents specified", file=sys.stderr)
         return
-    all_sections: List[Dict[str, object]] = []
-    # Parse each PDF and accumulate sections
-    # Also accumulate raw text for persona detection if needed
-    concatenated_text: List[str] = []
-    for doc in docs_info:
-        filename = doc.get("filename")
-        if not filename:
-            continue
-        pdf_path = os.path.join(input_dir, filename)
-        try:
-            sections = parse_pdf(pdf_path)
-        except Exception as exc:
-            print(f"Error processing {pdf_path}: {exc}", file=sys.stderr)
+    filenames = [doc.get("filename") for doc in docs_info if doc.get("filename")]
+    pdf_paths = [os.path.join(input_dir, filename) for filename in filenames]
+    # Parse the PDFs in parallel; sections come back annotated with their
+    # originating document, and a failing PDF is reported and skipped
+    results = parse_pdfs(pdf_paths, documents=filenames, workers=workers, return_exceptions=True)
+    all_sections: List[Section] = []
+    for pdf_path, sections in results.items():
+        if isinstance(sections, Exception):
+            print(f"Error processing {pdf_path}: {sections}", file=sys.stderr)
             continue
-        # Append text for persona detection
-        for sec in sections:
-            concatenated_text.append(str(sec.get("text", "")))
-            # Annotate each section with its originating document
-            sec_copy = sec.copy()
-            sec_copy["document"] = filename
-            all_sections.append(sec_copy)
+        all_sections.extend(sections)
     if not all_sections:
         print(f"No sections extracted from documents in {input_path}", file=sys.stderr)
         return
     # If persona or job descriptors are missing, attempt automatic detection
     if (not persona.get("role") or not job.get("task")) and detect_persona_and_job:
         try:
-            full_text = " ".join(concatenated_text)
-            detected_persona, detected_job = detect_persona_and_job(full_text)
+            detected_persona, detected_job = detect_persona_and_job(
+                sec.text for sec in all_sections
+            )
             # Only fill missing fields
             if not persona.get("role"):
                 persona.update(detected_persona)
@@ -96,17 +97,17 @@ def process_input_file(input_path: str, input_dir: str, output_dir: str) -> None
         except Exception:
             pass  # Silently ignore detection failures
     # Rank sections
-    ranked = rank_sections(all_sections, persona, job)
+    ranked = rank_sections(all_sections, persona, job, copy=False)
     # Determine the number of top sections to include – at most 5
     top_n = min(5, len(ranked))
     top_sections = ranked[:top_n]
     # Prepare extracted sections output (without internal score)
     extracted = [
         {
-            "document": sec.get("document"),
-            "section_title": sec.get("section_title"),
-            "importance_rank": sec.get("importance_rank"),
-            "page_number": sec.get("page_number"),
+            "document": sec.document,
+            "section_title": sec.section_title,
+            "importance_rank": sec.importance_rank,
+            "page_number": sec.page_number,
         }
         for sec in top_sections
     ]
@@ -128,11 +129,20 @@ def process_input_file(input_path: str, input_dir: str, output_dir: str) -> None
     base_name = os.path.splitext(os.path.basename(input_path))[0]
     output_filename = f"{base_name}_output.json"
     output_path = os.path.join(output_dir, output_filename)
-    with open(output_path, "w", encoding="utf-8") as out_f:
-        json.dump(output_data, out_f, ensure_ascii=False, indent=2)
+    write_json(output_path, output_data)
     print(f"Processed {input_path} -> {output_path}")
 
 
+def _process_input_file_safe(
+    input_path: str, input_dir: str, output_dir: str, workers: Optional[int] = None
+) -> None:
+    """Run ``process_input_file`` and report, rather than raise, any failure."""
+    try:
+        process_input_file(input_path, input_dir, output_dir, workers)
+    except Exception as exc:
+        print(f"Error processing {input_path}: {exc}", file=sys.stderr)
+
+
 def main() -> None:
     """Main entrypoint for CLI execution."""
     # Input and output directories default to /app/input and /app/output
@@ -142,14 +152,24 @@ def main() -> None:
     output_dir = "../output"
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
-    # Process each JSON file
-    for entry in os.listdir(input_dir):
-        if entry.lower().endswith(".json"):
-            input_path = os.path.join(input_dir, entry)
-            try:
-                process_input_file(input_path, input_dir, output_dir)
-            except Exception as exc:
-                print(f"Error processing {input_path}: {exc}", file=sys.stderr)
+    # Process each JSON file; input files are independent, so fan them out
+    # across worker processes when there is more than one
+    input_paths = [
+        os.path.join(input_dir, entry)
+        for entry in os.listdir(input_dir)
+        if entry.lower().endswith(".json")
+    ]
+    worker = partial(_process_input_file_safe, input_dir=input_dir, output_dir=output_dir)
+    if len(input_paths) <= 1:
+        # A single input parses its PDFs in parallel instead
+        for input_path in input_paths:
+            worker(input_path)
+        return
+    # Each input file already runs in its own process, so it parses its PDFs
+    # sequentially rather than starting a nested pool
+    worker = partial(worker, workers=1)
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(worker, input_paths))
 
 
 if __name__ == "__main__":
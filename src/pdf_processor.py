@@ -1,7 +1,9 @@
 """PDF processing utilities.
 
 This module wraps Poppler command‑line tools (``pdfinfo`` and ``pdftotext``)
-to extract text from PDF files without internet access.  It uses simple
+to extract text from PDF files without internet access.  When the optional
+``pypdfium2`` package is installed, text is extracted in‑process with PDFium
+instead, avoiding a subprocess per extraction.  It uses simple
 heuristics to detect headings and group subsequent lines into sections.  Each
 section contains a title, the concatenated text and the page number on which
 the section begins.
@@ -13,15 +15,88 @@ provide a reasonable approximation for most text‑heavy PDFs.
 
 from __future__ import annotations
 
+import codecs
+import functools
+import hashlib
+import json
 import os
 import re
 import subprocess
-from typing import List, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Optional in‑process PDF backend; fall back to the Poppler tools without it.
+try:
+    import pypdfium2 as pdfium  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    pdfium = None  # type: ignore
+
+# Number of pages handed to a worker process at a time when parsing in parallel.
+# Blocks amortise process start‑up and the per‑run PDF parse in ``pdftotext``.
+PAGE_BLOCK_SIZE = 8
+
+# Bytes read from the ``pdftotext`` pipe at a time
+_READ_SIZE = 1 << 16
+
+# ``pdftotext -enc`` names for the text encodings ``parse_pdf`` accepts, keyed
+# by the normalised Python codec name
+_PDFTOTEXT_ENCODINGS = {"utf-8": "UTF-8", "iso8859-1": "Latin1", "ascii": "ASCII7"}
+
+# Maximum number of distinct strings kept in a ``parse_pdf`` text pool before
+# it is reset, bounding its memory on documents with little repetition
+TEXT_POOL_SIZE = 4096
+
+# Environment variable naming the parsed‑section cache directory when
+# ``parse_pdf`` is not given one; caching is off when neither is set
+CACHE_DIR_ENV = "PDF_CACHE_DIR"
+# Version of the cached section format; bump whenever parsing output changes
+_CACHE_VERSION = 2
+
+# Enumerated heading prefixes such as "1. ", "2.3. " or "A. "
+_HEADING_ENUM_RE = re.compile(r"^(\d+\.\d*|\d+|[A-Z])\.\s")
+# Anything that is not an ASCII letter
+_NON_ALPHA_RE = re.compile(r"[^A-Za-z]")
+
+
+@dataclass(slots=True)
+class Section:
+    """A heading and the body text that follows it on one page of a PDF.
+
+    ``importance_rank`` and ``_score`` are left unset by ``parse_pdf`` and
+    filled in by ``persona_matcher.rank_sections``.
+    """
+
+    section_title: str
+    text: str
+    page_number: int
+    document: Optional[str] = None
+    importance_rank: Optional[int] = None
+    _score: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the section as a dictionary, omitting unset optional fields."""
+        data: Dict[str, object] = {
+            "section_title": self.section_title,
+            "text": self.text,
+            "page_number": self.page_number,
+        }
+        if self.document is not None:
+            data["document"] = self.document
+        if self.importance_rank is not None:
+            data["importance_rank"] = self.importance_rank
+        if self._score is not None:
+            data["_score"] = self._score
+        return data
 
 
 def _run_pdfinfo(filepath: str) -> int:
     """Return the number of pages in the PDF via the ``pdfinfo`` command.
 
+    Results are cached per path and modification time, so repeated calls for
+    an unchanged file do not spawn the command again.
+
     Args:
         filepath: Path to the PDF file.
 
@@ -31,6 +106,16 @@ def _run_pdfinfo(filepath: str) -> int:
     Raises:
         RuntimeError: If the command fails or page count cannot be parsed.
     """
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError as exc:
+        raise RuntimeError(f"pdfinfo failed for {filepath}: {exc}") from exc
+    return _run_pdfinfo_cached(filepath, mtime)
+
+
+@functools.lru_cache(maxsize=128)
+def _run_pdfinfo_cached(filepath: str, mtime: float) -> int:
+    """Run ``pdfinfo``; ``mtime`` only keys the cache to the file's version."""
     try:
         result = subprocess.run(
             ["pdfinfo", filepath], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
@@ -50,29 +135,157 @@ def _run_pdfinfo(filepath: str) -> int:
         raise RuntimeError(f"pdfinfo failed for {filepath}: {exc}") from exc
 
 
-def _run_pdftotext_page(filepath: str, page_num: int) -> str:
-    """Extract text from a single page of a PDF using ``pdftotext``.
+def _normalise_encoding(encoding: str) -> str:
+    """Return the Python codec name of a supported ``pdftotext`` encoding.
+
+    Raises:
+        ValueError: If ``encoding`` is not one of the encodings in
+            ``_PDFTOTEXT_ENCODINGS`` (under any of its aliases).
+    """
+    try:
+        codec = codecs.lookup(encoding).name
+    except LookupError:
+        codec = None
+    if codec not in _PDFTOTEXT_ENCODINGS:
+        raise ValueError(f"Unsupported encoding: {encoding}")
+    return codec
+
+
+def _run_pdftotext(
+    filepath: str,
+    first: Optional[int] = None,
+    last: Optional[int] = None,
+    codec: str = "utf-8",
+) -> Iterator[Tuple[int, str]]:
+    """Extract the text of a range of pages with a single ``pdftotext`` run.
+
+    ``pdftotext`` terminates each page with a form feed (``\\x0c``), so the
+    output is split on it to recover the individual pages.  Running the tool
+    once parses the PDF (cross‑reference table, fonts) once instead of once
+    per page.  The output is read incrementally and each page is yielded as
+    soon as its form feed arrives, so callers can parse early pages while
+    ``pdftotext`` is still working and only one page is buffered at a time.
 
     Args:
         filepath: Path to the PDF file.
-        page_num: 1‑based page number to extract.
+        first: 1‑based first page to extract.  Defaults to the first page.
+        last: 1‑based last page to extract.  Defaults to the last page.
+        codec: Normalised codec name (see ``_normalise_encoding``) of the
+            text encoding ``pdftotext`` emits and the output is decoded with.
 
-    Returns:
-        A string containing the plain text of the page.
+    Yields:
+        ``(page_number, page_text)`` tuples with 1‑based page numbers.
 
     Raises:
         RuntimeError: If the command fails.
     """
+    cmd = ["pdftotext", "-enc", _PDFTOTEXT_ENCODINGS[codec]]
+    if first is not None:
+        cmd += ["-f", str(first)]
+    if last is not None:
+        cmd += ["-l", str(last)]
+    cmd += [filepath, "-"]
     try:
-        result = subprocess.run(
-            ["pdftotext", "-f", str(page_num), "-l", str(page_num), filepath, "-"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True,
-        )
-        return result.stdout.decode("utf-8", errors="ignore")
+        # stderr is discarded rather than piped: an unread pipe could fill up
+        # with warnings and stall the process while stdout is being streamed
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError as exc:
+        raise RuntimeError(f"pdftotext failed for {filepath}: {exc}") from exc
+    # The incremental decoder carries multi‑byte characters split across reads
+    decoder = codecs.getincrementaldecoder(codec)(errors="ignore")
+    page_num = first or 1
+    pending: List[str] = []
+    try:
+        for chunk in iter(functools.partial(proc.stdout.read, _READ_SIZE), b""):
+            *done, rest = decoder.decode(chunk).split("\x0c")
+            for part in done:
+                pending.append(part)
+                yield page_num, "".join(pending)
+                page_num += 1
+                pending = []
+            pending.append(rest)
+        pending.append(decoder.decode(b"", final=True))
+        returncode = proc.wait()
+        if returncode != 0:
+            raise RuntimeError(
+                f"pdftotext failed for {filepath}: exit status {returncode}"
+            )
+        # Output ends with a form feed; anything after it is a final page
+        tail = "".join(pending)
+        if tail:
+            yield page_num, tail
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+
+def _run_pdfium(
+    filepath: str, first: Optional[int] = None, last: Optional[int] = None
+) -> List[Tuple[int, str]]:
+    """Extract the text of a range of pages in‑process with ``pypdfium2``.
+
+    Args:
+        filepath: Path to the PDF file.
+        first: 1‑based first page to extract.  Defaults to the first page.
+        last: 1‑based last page to extract.  Defaults to the last page.
+
+    Returns:
+        A list of ``(page_number, page_text)`` tuples with 1‑based page numbers.
+
+    Raises:
+        RuntimeError: If the document cannot be opened or read.
+    """
+    try:
+        pdf = pdfium.PdfDocument(filepath)
+    except Exception as exc:
+        raise RuntimeError(f"pypdfium2 failed to open {filepath}: {exc}") from exc
+    try:
+        num_pages = len(pdf)
+        last = num_pages if last is None else min(last, num_pages)
+        pages: List[Tuple[int, str]] = []
+        for page_num in range(first or 1, last + 1):
+            page = pdf[page_num - 1]
+            textpage = page.get_textpage()
+            pages.append((page_num, textpage.get_text_range()))
+            textpage.close()
+            page.close()
+        return pages
     except Exception as exc:
-        raise RuntimeError(f"pdftotext failed on page {page_num} of {filepath}: {exc}") from exc
+        raise RuntimeError(f"pypdfium2 failed for {filepath}: {exc}") from exc
+    finally:
+        pdf.close()
+
+
+def _extract_pages(
+    filepath: str,
+    first: Optional[int] = None,
+    last: Optional[int] = None,
+    codec: str = "utf-8",
+) -> Iterable[Tuple[int, str]]:
+    """Extract page texts with PDFium when available, else with ``pdftotext``.
+
+    PDFium returns decoded text directly, so ``codec`` only applies to the
+    ``pdftotext`` fallback.
+    """
+    if pdfium is not None:
+        return _run_pdfium(filepath, first, last)
+    return _run_pdftotext(filepath, first, last, codec)
+
+
+def _page_count(filepath: str) -> int:
+    """Return the number of pages with PDFium when available, else ``pdfinfo``."""
+    if pdfium is not None:
+        try:
+            pdf = pdfium.PdfDocument(filepath)
+        except Exception as exc:
+            raise RuntimeError(f"pypdfium2 failed to open {filepath}: {exc}") from exc
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    return _run_pdfinfo(filepath)
 
 
 def _is_heading(line: str) -> bool:
@@ -91,90 +304,349 @@ def _is_heading(line: str) -> bool:
         True if the line is likely a heading, False otherwise.
     """
     text = line.strip()
-    if not text:
-        return False
-    # Exclude very long lines
-    if len(text) > 100:
+    # Exclude empty and very long lines
+    if not text or len(text) > 100:
         return False
     words = text.split()
-    if len(words) > 15:
+    num_words = len(words)
+    if num_words > 15:
         return False
-    # Check enumeration patterns (e.g. "1.", "2.3", "A.")
-    if re.match(r"^(\d+\.\d*|\d+|[A-Z])\.\s", text):
-        return True
-    # Count words starting with uppercase or digits
-    cap_count = sum(1 for w in words if w and (w[0].isupper() or w[0].isdigit()))
-    if cap_count / len(words) >= 0.6:
+    # The remaining checks are alternatives, so the cheapest run first and the
+    # regular expressions last.
+    # Count words starting with uppercase or digits (at least 60% of them;
+    # compared in integers; split() never yields empty words)
+    cap_count = 0
+    for w in words:
+        first = w[0]
+        if first.isupper() or first.isdigit():
+            cap_count += 1
+    if cap_count * 5 >= num_words * 3:
         return True
-    # All uppercase (ignore numbers)
-    letters_only = re.sub(r"[^A-Za-z]", "", text)
-    if letters_only and letters_only.isupper():
-        return True
-    return False
+    # All uppercase (ignore numbers).  Only ASCII letters count, so for ASCII
+    # text this is exactly str.isupper()
+    if text.isascii():
+        if text.isupper():
+            return True
+    else:
+        letters_only = _NON_ALPHA_RE.sub("", text)
+        if letters_only and letters_only.isupper():
+            return True
+    # Check enumeration patterns (e.g. "1.", "2.3", "A.")
+    return _HEADING_ENUM_RE.match(text) is not None
+
 
+def _pooled(pool: Dict[str, str], value: str) -> str:
+    """Return the pooled string equal to ``value``, adding it if unseen."""
+    if len(pool) >= TEXT_POOL_SIZE:
+        pool.clear()
+    return pool.setdefault(value, value)
 
-def parse_pdf(filepath: str) -> List[Dict[str, object]]:
+
+def _new_section(
+    title: str,
+    text: str,
+    page_num: int,
+    document: Optional[str],
+    pool: Optional[Dict[str, str]] = None,
+) -> Section:
+    """Build a section, tagged with its document name if given.
+
+    With a ``pool``, titles and texts equal to earlier ones (running headers,
+    footers, boilerplate) share a single string object, which saves memory
+    and lets later hashing of the repeats reuse the cached hash.
+    """
+    if pool is not None:
+        title = _pooled(pool, title)
+        text = _pooled(pool, text)
+    return Section(title, text, page_num, document)
+
+
+def _parse_page(
+    page_text: str,
+    page_num: int,
+    document: Optional[str],
+    pool: Optional[Dict[str, str]] = None,
+) -> List[Section]:
+    """Split the text of one page into sections using the heading heuristic.
+
+    Args:
+        page_text: Plain text of the page.
+        page_num: 1‑based page number.
+        document: Optional document name to tag each section with.
+        pool: Optional string pool shared across pages (see ``_new_section``).
+
+    Returns:
+        The sections found on the page, in order.
+    """
+    sections: List[Section] = []
+    # Lines are stripped and non‑empty, so joining them with single spaces
+    # needs no further trimming.  splitlines() is kept over a find("\n") scan:
+    # it is faster than splitting line by line in Python, and it also splits
+    # on lone "\r", "\v", "\f", "\x1c"-"\x1e", "\x85", "\u2028" and "\u2029",
+    # so a "\n"-only scan would change the sections
+    lines = list(filter(None, map(str.strip, page_text.splitlines())))
+    current_title = None
+    current_lines: List[str] = []
+    for line in lines:
+        if _is_heading(line):
+            # Flush previous section; like at the end of the page, a heading
+            # directly followed by another one (e.g. in a table of contents)
+            # has no body and is dropped rather than ranked as an empty section
+            if current_title is not None and current_lines:
+                sections.append(
+                    _new_section(
+                        current_title, " ".join(current_lines), page_num, document, pool
+                    )
+                )
+            current_title = line
+            current_lines = []
+        else:
+            current_lines.append(line)
+    # Flush remainder of page
+    if current_title is not None and current_lines:
+        sections.append(
+            _new_section(current_title, " ".join(current_lines), page_num, document, pool)
+        )
+    elif current_title is None and lines:
+        # No headings detected on this page – treat whole page as a section
+        sections.append(
+            _new_section(f"Page {page_num}", " ".join(lines), page_num, document, pool)
+        )
+    return sections
+
+
+def _cache_key(filepath: str, document: Optional[str], codec: str) -> str:
+    """Return the cache key for parsing ``filepath`` with the given options.
+
+    The key hashes the full file content, so renamed or copied files still
+    hit and modified files never do, together with everything else that
+    affects the sections: the cache format version, the text backend, the
+    normalised encoding and the document name.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(filepath, "rb") as f:
+        for block in iter(functools.partial(f.read, 1 << 20), b""):
+            digest.update(block)
+    backend = "pdfium" if pdfium is not None else "pdftotext"
+    digest.update(f"\0{_CACHE_VERSION}\0{backend}\0{codec}\0{document}".encode())
+    return digest.hexdigest()
+
+
+def _load_cached_sections(path: str) -> Optional[List[Section]]:
+    """Load cached sections, or return None if missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [Section(**item) for item in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_sections(path: str, sections: List[Section]) -> None:
+    """Write sections to the cache; failures only cost the next parse."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([section.to_dict() for section in sections], f, ensure_ascii=False)
+        # Atomic rename, so concurrent readers never see a partial file
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _parse_page_range(
+    filepath: str, first: int, last: int, document: Optional[str], codec: str
+) -> List[Section]:
+    """Extract and parse pages ``first`` to ``last`` of a PDF (worker task)."""
+    sections: List[Section] = []
+    pool: Dict[str, str] = {}
+    for page_num, page_text in _extract_pages(filepath, first, last, codec):
+        sections.extend(_parse_page(page_text, page_num, document, pool))
+    return sections
+
+
+def parse_pdf(
+    filepath: str,
+    document: Optional[str] = None,
+    workers: int = 1,
+    encoding: str = "utf-8",
+    cache_dir: Optional[str] = None,
+) -> List[Section]:
     """Parse a PDF into a list of sections.
 
     Each section contains a title (heading) and the associated body text.  The
-    function iterates through each page, extracts text with ``pdftotext`` and
-    applies a simple heading detection heuristic.  Consecutive lines after a
-    heading are grouped until the next heading or end of page.
+    function extracts the text of all pages in one pass (PDFium if installed,
+    otherwise a single ``pdftotext`` run) and applies a simple heading
+    detection heuristic to each page.  Consecutive lines after a heading are
+    grouped until the next heading or end of page; headings with no lines
+    after them produce no section.
+
+    With ``workers > 1``, documents longer than ``PAGE_BLOCK_SIZE`` pages are
+    split into blocks of pages that are extracted and parsed in separate
+    processes; the sections are returned in page order either way.  Equal
+    section titles and texts are pooled so that repeats share one string
+    (per page block when parsing in parallel).  To parse several documents
+    at once, see ``parse_pdfs``.
 
     Args:
         filepath: Path to the PDF file.
+        document: Optional document name.  When given, every section also
+            carries it in its ``document`` field.
+        workers: Maximum number of worker processes to parse page blocks
+            with.  Defaults to 1 (parse in the calling process).
+        encoding: Text encoding requested from ``pdftotext``.  Defaults to
+            ``"utf-8"``.  ``"latin-1"`` decodes slightly faster (one byte per
+            character, no validation) but ``pdftotext`` drops characters
+            outside Latin‑1, so use it only for Western European documents.
+        cache_dir: Directory to cache parsed sections in, keyed by a hash of
+            the file content and the options above, so that parsing an
+            unchanged PDF again only loads a JSON file.  Defaults to the
+            ``PDF_CACHE_DIR`` environment variable; without either, nothing
+            is cached.
 
     Returns:
-        A list of dictionaries, each with keys ``section_title``, ``text`` and
-        ``page_number``.
+        A list of ``Section`` objects with ``section_title``, ``text`` and
+        ``page_number`` set (plus ``document`` when requested).  Use
+        ``Section.to_dict`` for a plain dictionary.
+
+    Raises:
+        ValueError: If ``filepath`` is not an existing ``.pdf`` file or
+            ``encoding`` is not supported.
+        RuntimeError: If text extraction fails.
     """
     if not os.path.exists(filepath) or not filepath.lower().endswith(".pdf"):
         raise ValueError(f"Invalid PDF path: {filepath}")
-    num_pages = _run_pdfinfo(filepath)
-    sections: List[Dict[str, object]] = []
-    for page_num in range(1, num_pages + 1):
-        try:
-            page_text = _run_pdftotext_page(filepath, page_num)
-        except RuntimeError:
-            # If extraction fails for a page, skip it
-            continue
-        lines = [ln.strip() for ln in page_text.splitlines() if ln.strip()]
-        current_title = None
-        current_lines: List[str] = []
-        for line in lines:
-            if _is_heading(line):
-                # Flush previous section
-                if current_title is not None:
-                    sections.append(
-                        {
-                            "section_title": current_title,
-                            "text": " ".join(current_lines).strip(),
-                            "page_number": page_num,
-                        }
-                    )
-                current_title = line
-                current_lines = []
-            else:
-                current_lines.append(line)
-        # Flush remainder of page
-        if current_title is not None and current_lines:
-            sections.append(
-                {
-                    "section_title": current_title,
-                    "text": " ".join(current_lines).strip(),
-                    "page_number": page_num,
-                }
-            )
-        elif current_title is None and lines:
-            # No headings detected on this page – treat whole page as a section
-            sections.append(
-                {
-                    "section_title": f"Page {page_num}",
-                    "text": " ".join(lines).strip(),
-                    "page_number": page_num,
-                }
-            )
+    # Checked up front for both backends, and so that aliases share a cache key
+    codec = _normalise_encoding(encoding)
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV) or None
+    if cache_dir is None:
+        return _parse_pdf_uncached(filepath, document, workers, codec)
+    cache_path = os.path.join(cache_dir, _cache_key(filepath, document, codec) + ".json")
+    sections = _load_cached_sections(cache_path)
+    if sections is None:
+        sections = _parse_pdf_uncached(filepath, document, workers, codec)
+        _store_cached_sections(cache_path, sections)
     return sections
 
 
-__all__ = ["parse_pdf"]
\ No newline at end of file
+def _parse_pdf_uncached(
+    filepath: str, document: Optional[str], workers: int, codec: str
+) -> List[Section]:
+    """Extract and parse a PDF (see ``parse_pdf``) without consulting the cache."""
+    if workers > 1:
+        num_pages = _page_count(filepath)
+        if num_pages > PAGE_BLOCK_SIZE:
+            firsts = range(1, num_pages + 1, PAGE_BLOCK_SIZE)
+            lasts = [min(first + PAGE_BLOCK_SIZE - 1, num_pages) for first in firsts]
+            sections: List[Section] = []
+            # Only the path and page bounds cross the process boundary; map()
+            # yields the blocks in page order
+            with ProcessPoolExecutor(max_workers=min(workers, len(lasts))) as executor:
+                for block in executor.map(
+                    _parse_page_range,
+                    repeat(filepath),
+                    firsts,
+                    lasts,
+                    repeat(document),
+                    repeat(codec),
+                ):
+                    sections.extend(block)
+            return sections
+    sections = []
+    # Repeated titles and texts share one string object (see _new_section)
+    pool: Dict[str, str] = {}
+    for page_num, page_text in _extract_pages(filepath, codec=codec):
+        sections.extend(_parse_page(page_text, page_num, document, pool))
+    return sections
+
+
+def _parse_pdf_task(
+    filepath: str,
+    document: Optional[str],
+    workers: int,
+    encoding: str,
+    cache_dir: Optional[str],
+    return_exceptions: bool,
+) -> Union[List[Section], Exception]:
+    """Parse one PDF for ``parse_pdfs``, optionally returning its error."""
+    try:
+        return parse_pdf(
+            filepath, document, workers=workers, encoding=encoding, cache_dir=cache_dir
+        )
+    except Exception as exc:
+        if not return_exceptions:
+            raise
+        return exc
+
+
+def parse_pdfs(
+    paths: Sequence[str],
+    documents: Optional[Sequence[Optional[str]]] = None,
+    workers: Optional[int] = None,
+    encoding: str = "utf-8",
+    cache_dir: Optional[str] = None,
+    return_exceptions: bool = False,
+) -> Dict[str, Union[List[Section], Exception]]:
+    """Parse several PDFs, in parallel across documents or pages.
+
+    Several documents are parsed in one process pool, each as a whole in its
+    own worker, which needs no coordination within a document.  A single
+    document is instead split into page blocks across the workers when it is
+    long enough (see ``parse_pdf``).  A path given more than once is parsed
+    once, tagged with the first document name given for it.
+
+    Args:
+        paths: Paths of the PDF files.
+        documents: Optional document names, one per path, to tag the
+            sections of each file with (see ``parse_pdf``).
+        workers: Maximum number of worker processes.  Defaults to the number
+            of CPUs; 1 parses everything in the calling process.
+        encoding: Text encoding requested from ``pdftotext``.
+        cache_dir: Parsed‑section cache directory (see ``parse_pdf``).
+        return_exceptions: When True, a document that fails to parse maps to
+            its exception instead of the error propagating.
+
+    Returns:
+        A dictionary mapping each distinct path to its sections, in input
+        order.
+
+    Raises:
+        ValueError: If ``documents`` and ``paths`` differ in length, or as
+            ``parse_pdf`` unless ``return_exceptions`` is set.
+        RuntimeError: As ``parse_pdf`` unless ``return_exceptions`` is set.
+    """
+    if documents is None:
+        documents = [None] * len(paths)
+    elif len(documents) != len(paths):
+        raise ValueError("documents must have one entry per path")
+    jobs: Dict[str, Optional[str]] = {}
+    for path, document in zip(paths, documents):
+        jobs.setdefault(path, document)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            results = list(
+                executor.map(
+                    _parse_pdf_task,
+                    jobs.keys(),
+                    jobs.values(),
+                    repeat(1),
+                    repeat(encoding),
+                    repeat(cache_dir),
+                    repeat(return_exceptions),
+                )
+            )
+    else:
+        results = [
+            _parse_pdf_task(path, document, workers, encoding, cache_dir, return_exceptions)
+            for path, document in jobs.items()
+        ]
+    return dict(zip(jobs, results))
+
+
+__all__ = ["Section", "parse_pdf", "parse_pdfs"]
\ No newline at end of file
@@ -7,7 +7,8 @@ Each section is annotated with an ``importance_rank`` field starting at 1.
 
 from __future__ import annotations
 
-from typing import List, Dict
+from dataclasses import replace
+from typing import TYPE_CHECKING, List, Dict
 # When executed without package context, modify sys.path so local modules are importable.
 if __package__ is None or __package__ == "":
     import os as _os, sys as _sys
@@ -17,38 +18,47 @@ if __package__ is None or __package__ == "":
 
 from content_analyzer import compute_relevance_scores  # type: ignore
 
+if TYPE_CHECKING:
+    from pdf_processor import Section  # type: ignore
+
 
 def rank_sections(
-    sections: List[Dict[str, object]],
+    sections: List[Section],
     persona: Dict[str, str],
     job: Dict[str, str],
-) -> List[Dict[str, object]]:
+    copy: bool = True,
+) -> List[Section]:
     """Rank sections based on persona and job relevance.
 
     Args:
-        sections: List of section dictionaries.  Each must contain at least
-            ``section_title``, ``text``, ``page_number`` and ``document`` keys.
+        sections: List of sections.  Each must have at least
+            ``section_title``, ``text``, ``page_number`` and ``document`` set.
         persona: Persona definition with ``role`` and optional ``description``.
         job: Job‑to‑be‑done definition with ``task``.
+        copy: Whether to return copies of the sections.  Pass False when the
+            input sections are not needed afterwards to annotate them in
+            place and skip a copy per section.
 
     Returns:
         A new list of sections sorted by descending relevance score.  Each
-        dictionary includes an added ``importance_rank`` key.
+        section has ``importance_rank`` (and the raw ``_score``) set.
     """
     if not sections:
         return []
     scores = compute_relevance_scores(sections, persona, job)
-    # Pair each section with its score
-    paired = list(zip(sections, scores))
-    # Sort by score descending; stable sort ensures original order for ties
-    paired.sort(key=lambda x: x[1], reverse=True)
-    ranked_sections = []
-    for idx, (section, score) in enumerate(paired, start=1):
-        sec_copy = section.copy()
-        sec_copy["importance_rank"] = idx
-        sec_copy["_score"] = float(score)
-        ranked_sections.append(sec_copy)
-    return ranked_sections
+    # Sort the indices by score descending; the sort is stable, so ties keep
+    # their original order
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    if not copy:
+        for rank, i in enumerate(order, start=1):
+            section = sections[i]
+            section.importance_rank = rank
+            section._score = float(scores[i])
+        return [sections[i] for i in order]
+    return [
+        replace(sections[i], importance_rank=rank, _score=float(scores[i]))
+        for rank, i in enumerate(order, start=1)
+    ]
 
 
 __all__ = ["rank_sections"]
\ No newline at end of file
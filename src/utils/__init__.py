@@ -1,3 +1,55 @@
 """Utility functions for text processing and other helpers."""
 
-__all__ = []
\ No newline at end of file
+from __future__ import annotations
+
+import json
+import re
+
+# orjson is an optional, much faster JSON encoder.  Fall back to the standard
+# library when it is not installed.
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore
+
+# Characters that are not ASCII letters, digits or whitespace
+_NONALNUM = re.compile(r"[^a-zA-Z0-9\s]")
+# Translation table mapping the same characters to spaces, restricted to ASCII
+_ASCII_NONALNUM_TABLE = str.maketrans(
+    {chr(c): " " for c in range(128) if not (chr(c).isalnum() or chr(c).isspace())}
+)
+
+
+def clean_text(text: str) -> str:
+    """Lowercase and replace non‑alphanumeric characters with spaces.
+
+    Only ASCII letters and digits are kept.  Pure ASCII text goes through a
+    ``str.translate`` table and everything else through the equivalent
+    regular expression.
+    """
+    lower = text.lower()
+    if lower.isascii():
+        return lower.translate(_ASCII_NONALNUM_TABLE)
+    return _NONALNUM.sub(" ", lower)
+
+
+def write_json(path: str, data: object) -> None:
+    """Write ``data`` to ``path`` as UTF‑8 JSON indented by two spaces.
+
+    Uses ``orjson`` when available and the standard ``json`` module
+    otherwise; both produce the same layout with non‑ASCII characters kept
+    as is.
+
+    Args:
+        path: Destination file path.
+        data: JSON‑serialisable object.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+__all__ = ["clean_text", "write_json"]
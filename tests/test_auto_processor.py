@@ -0,0 +1,39 @@
+"""Unit tests for automatic persona detection."""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add the src directory to sys.path so that modules can be imported directly
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from auto_processor import detect_persona_and_job  # type: ignore
+
+
+class TestDetectPersonaAndJob(unittest.TestCase):
+    def test_default_persona(self):
+        persona, job = detect_persona_and_job("Nothing relevant here.")
+        self.assertEqual(persona["role"], "Reader")
+        self.assertEqual(job["task"], "Summarise the key sections of the document")
+
+    def test_rule_priority_not_first_occurrence(self):
+        # "student" occurs first, but the research rule has higher priority
+        persona, _ = detect_persona_and_job("A Student guide to the RESEARCH process")
+        self.assertEqual(persona["role"], "Researcher")
+
+    def test_chunks_match_joined_text(self):
+        chunks = ["Quarterly financial summary", "", "Notes for the nursing staff"]
+        self.assertEqual(
+            detect_persona_and_job(chunks),
+            detect_persona_and_job(" ".join(chunks)),
+        )
+        persona, _ = detect_persona_and_job(iter(chunks))
+        self.assertEqual(persona["role"], "Business Analyst")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Unit tests for relevance scoring."""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add the src directory to sys.path so that modules can be imported directly
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from content_analyzer import compute_relevance_scores, compute_semantic_similarity  # type: ignore
+from pdf_processor import Section  # type: ignore
+from persona_matcher import rank_sections  # type: ignore
+
+PERSONA = {"role": "Researcher in protein biology", "description": "studies models"}
+JOB = {"task": "evaluate protein prediction models"}
+QUERY = f"{PERSONA['role']} {PERSONA['description']} {JOB['task']}"
+
+
+def _sections():
+    return [
+        Section(
+            "Introduction",
+            "We evaluate machine learning models for protein structure prediction.",
+            1,
+            "a.pdf",
+        ),
+        Section(
+            "Methods",
+            "Build and train models on protein datasets, then evaluate their accuracy.",
+            2,
+            "a.pdf",
+        ),
+        Section("Recipes", "Cooking pasta with tomato sauce and fresh basil.", 3, "b.pdf"),
+        Section("Methods", "Design experiments to compare sequence alignment tools.", 4, "b.pdf"),
+        Section("Appendix", "", 5, "b.pdf"),
+    ]
+
+
+class TestSemanticSimilarity(unittest.TestCase):
+    def test_matches_reference_values(self):
+        sims = compute_semantic_similarity(_sections(), QUERY)
+        expected = [0.3839315384749517, 0.2648635395219005, 0.0, 0.0, 0.0]
+        self.assertEqual(len(sims), len(expected))
+        for sim, value in zip(sims, expected):
+            self.assertAlmostEqual(sim, value, places=12)
+
+    def test_query_disjoint_sections_score_zero(self):
+        sims = compute_semantic_similarity(_sections(), QUERY)
+        # "Recipes" shares no term with the query and "Appendix" is empty
+        self.assertEqual(sims[2], 0.0)
+        self.assertEqual(sims[4], 0.0)
+
+    def test_empty_query_scores_zero(self):
+        self.assertEqual(compute_semantic_similarity(_sections(), ""), [0.0] * 5)
+
+
+class TestRelevanceScores(unittest.TestCase):
+    def test_matches_reference_values(self):
+        scores = compute_relevance_scores(_sections(), PERSONA, JOB)
+        expected = [0.7277777777777779, 0.8032214451863307, 0.0, 0.35, 0.0]
+        self.assertEqual(len(scores), len(expected))
+        for score, value in zip(scores, expected):
+            self.assertAlmostEqual(score, value, places=12)
+
+    def test_constant_components_normalise_to_zero(self):
+        # Identical sections make every component constant
+        section = _sections()[0]
+        scores = compute_relevance_scores([section, section], PERSONA, JOB)
+        self.assertEqual(scores, [0.0, 0.0])
+
+    def test_ranking_order(self):
+        ranked = rank_sections(_sections(), PERSONA, JOB)
+        order = [(sec.section_title, sec.page_number) for sec in ranked]
+        self.assertEqual(
+            order,
+            [("Methods", 2), ("Introduction", 1), ("Methods", 4), ("Recipes", 3), ("Appendix", 5)],
+        )
+        self.assertEqual([sec.importance_rank for sec in ranked], [1, 2, 3, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
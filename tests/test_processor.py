@@ -1,8 +1,11 @@
 """Unit tests for the PDF processor."""
 
+import io
 import os
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 import sys
 
 # Add the src directory to sys.path so that modules can be imported directly
@@ -12,7 +15,8 @@ SRC_DIR = PROJECT_ROOT / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from pdf_processor import parse_pdf  # type: ignore
+import pdf_processor  # type: ignore
+from pdf_processor import Section, _parse_page, _run_pdftotext, parse_pdf, parse_pdfs  # type: ignore
 
 
 class TestPDFProcessor(unittest.TestCase):
@@ -26,14 +30,188 @@ class TestPDFProcessor(unittest.TestCase):
         sections = parse_pdf(str(self.sample_pdf))
         # Ensure we extracted at least one section
         self.assertTrue(len(sections) > 0)
-        # Check keys in first section
+        # Check fields of the first section
         first = sections[0]
-        self.assertIn("section_title", first)
-        self.assertIn("text", first)
-        self.assertIn("page_number", first)
+        self.assertIsInstance(first, Section)
+        self.assertIsInstance(first.section_title, str)
+        self.assertIsInstance(first.text, str)
         # Ensure page_number is integer and >= 1
-        self.assertIsInstance(first["page_number"], int)
-        self.assertGreaterEqual(first["page_number"], 1)
+        self.assertIsInstance(first.page_number, int)
+        self.assertGreaterEqual(first.page_number, 1)
+
+
+class _FakePopen:
+    """Stand-in for a ``pdftotext`` process whose output is fixed bytes."""
+
+    def __init__(self, output: bytes, returncode: int = 0) -> None:
+        self.stdout = io.BytesIO(output)
+        self.returncode = returncode
+        self.finished = False
+        self.killed = False
+
+    def poll(self):
+        return self.returncode if self.finished else None
+
+    def wait(self):
+        self.finished = True
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+        self.finished = True
+
+
+class TestRunPdftotext(unittest.TestCase):
+    def run_pdftotext(self, output: bytes, returncode: int = 0, **kwargs):
+        fake = _FakePopen(output, returncode)
+        # Read one byte at a time so every page and character straddles reads
+        with mock.patch.object(pdf_processor.subprocess, "Popen", return_value=fake), \
+                mock.patch.object(pdf_processor, "_READ_SIZE", 1):
+            return list(_run_pdftotext("doc.pdf", **kwargs)), fake
+
+    def test_pages_split_across_reads(self):
+        pages, _ = self.run_pdftotext(b"first page\nline\x0csecond\x0c")
+        self.assertEqual(pages, [(1, "first page\nline"), (2, "second")])
+
+    def test_page_numbers_start_at_first(self):
+        pages, _ = self.run_pdftotext(b"a\x0cb\x0c", first=3, last=4)
+        self.assertEqual(pages, [(3, "a"), (4, "b")])
+
+    def test_multibyte_character_split_across_reads(self):
+        pages, _ = self.run_pdftotext("Café\x0c".encode("utf-8"))
+        self.assertEqual(pages, [(1, "Café")])
+
+    def test_trailing_form_feed_adds_no_page(self):
+        pages, _ = self.run_pdftotext(b"a\x0c\x0c")
+        self.assertEqual(pages, [(1, "a"), (2, "")])
+        pages, _ = self.run_pdftotext(b"a\x0cb")
+        self.assertEqual(pages, [(1, "a"), (2, "b")])
+
+    def test_nonzero_exit_raises(self):
+        with self.assertRaises(RuntimeError):
+            self.run_pdftotext(b"a\x0cb\x0c", returncode=1)
+
+    def test_process_killed_when_caller_stops_early(self):
+        fake = _FakePopen(b"a\x0cb\x0c")
+        with mock.patch.object(pdf_processor.subprocess, "Popen", return_value=fake):
+            pages = _run_pdftotext("doc.pdf")
+            self.assertEqual(next(pages), (1, "a"))
+            pages.close()
+        self.assertTrue(fake.killed)
+
+
+class TestSectionCache(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = tmp.name
+        self.pdf_path = os.path.join(self.tmp_dir, "doc.pdf")
+        with open(self.pdf_path, "wb") as f:
+            f.write(b"%PDF-1.4 fake content")
+
+    def test_store_and_load_round_trip(self):
+        sections = [Section("Intro", "Body text.", 1, "doc.pdf"), Section("Page 2", "More.", 2)]
+        path = os.path.join(self.tmp_dir, "cache", "entry.json")
+        pdf_processor._store_cached_sections(path, sections)
+        loaded = pdf_processor._load_cached_sections(path)
+        self.assertEqual(loaded, sections)
+        self.assertEqual(loaded[0].document, "doc.pdf")
+        self.assertIsNone(loaded[1].document)
+        self.assertIsNone(loaded[0].importance_rank)
+        self.assertIsNone(loaded[0]._score)
+
+    def test_corrupt_entry_is_reparsed(self):
+        cache_dir = os.path.join(self.tmp_dir, "cache")
+        sections = [Section("Intro", "Body text.", 1)]
+        key = pdf_processor._cache_key(self.pdf_path, None, "utf-8")
+        os.makedirs(cache_dir)
+        with open(os.path.join(cache_dir, key + ".json"), "w", encoding="utf-8") as f:
+            f.write('[{"section_title": "Intro", "te')
+        with mock.patch.object(
+            pdf_processor, "_parse_pdf_uncached", return_value=sections
+        ) as parse:
+            self.assertEqual(parse_pdf(self.pdf_path, cache_dir=cache_dir), sections)
+            # The rewritten entry is served without parsing again
+            self.assertEqual(parse_pdf(self.pdf_path, cache_dir=cache_dir), sections)
+        self.assertEqual(parse.call_count, 1)
+
+    def test_cache_key_depends_on_options_and_content(self):
+        key = pdf_processor._cache_key(self.pdf_path, None, "utf-8")
+        self.assertEqual(key, pdf_processor._cache_key(self.pdf_path, None, "utf-8"))
+        self.assertNotEqual(key, pdf_processor._cache_key(self.pdf_path, "doc.pdf", "utf-8"))
+        self.assertNotEqual(key, pdf_processor._cache_key(self.pdf_path, None, "iso8859-1"))
+        with open(self.pdf_path, "ab") as f:
+            f.write(b" changed")
+        self.assertNotEqual(key, pdf_processor._cache_key(self.pdf_path, None, "utf-8"))
+
+    def test_unsupported_encoding_rejected_before_cache_and_backend(self):
+        cache_dir = os.path.join(self.tmp_dir, "cache")
+        # A stand-in PDFium backend ignores the encoding, so the check must
+        # not rely on pdftotext
+        with mock.patch.object(pdf_processor, "pdfium", object()), \
+                mock.patch.object(pdf_processor, "_parse_pdf_uncached") as parse:
+            with self.assertRaises(ValueError):
+                parse_pdf(self.pdf_path, encoding="bogus", cache_dir=cache_dir)
+        parse.assert_not_called()
+        self.assertFalse(os.path.exists(cache_dir))
+
+    def test_encoding_aliases_share_cache_entry(self):
+        cache_dir = os.path.join(self.tmp_dir, "cache")
+        sections = [Section("Intro", "Body text.", 1)]
+        with mock.patch.object(
+            pdf_processor, "_parse_pdf_uncached", return_value=sections
+        ) as parse:
+            parse_pdf(self.pdf_path, encoding="latin-1", cache_dir=cache_dir)
+            parse_pdf(self.pdf_path, encoding="ISO-8859-1", cache_dir=cache_dir)
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+
+class TestParsePage(unittest.TestCase):
+    def test_heading_without_body_is_dropped(self):
+        sections = _parse_page("H1\nH2\nbody", 1, "a.pdf")
+        self.assertEqual(sections, [Section("H2", "body", 1, "a.pdf")])
+
+    def test_page_without_headings_becomes_one_section(self):
+        sections = _parse_page("first line of text\n\n  second line\n", 3, None)
+        self.assertEqual(sections, [Section("Page 3", "first line of text second line", 3)])
+
+
+class TestParsePDFs(unittest.TestCase):
+    def test_documents_must_match_paths(self):
+        with self.assertRaises(ValueError):
+            parse_pdfs(["a.pdf", "b.pdf"], documents=["a.pdf"], workers=1)
+
+    def test_return_exceptions_maps_failures(self):
+        results = parse_pdfs(["missing.pdf"], workers=1, return_exceptions=True)
+        self.assertIsInstance(results["missing.pdf"], ValueError)
+
+    def test_duplicate_paths_parsed_once(self):
+        with mock.patch.object(pdf_processor, "parse_pdf", return_value=[]) as parse:
+            results = parse_pdfs(
+                ["a.pdf", "b.pdf", "a.pdf"], documents=["a", "b", "c"], workers=1
+            )
+        self.assertEqual(list(results), ["a.pdf", "b.pdf"])
+        calls = [c.args[:2] for c in parse.call_args_list]
+        self.assertEqual(calls, [("a.pdf", "a"), ("b.pdf", "b")])
+
+
+class TestSection(unittest.TestCase):
+    def test_to_dict_omits_unset_fields(self):
+        section = Section("Introduction", "Some text.", 1)
+        self.assertEqual(
+            section.to_dict(),
+            {"section_title": "Introduction", "text": "Some text.", "page_number": 1},
+        )
+
+    def test_to_dict_includes_set_fields(self):
+        section = Section("Introduction", "Some text.", 2, document="a.pdf")
+        section.importance_rank = 1
+        section._score = 0.5
+        data = section.to_dict()
+        self.assertEqual(data["document"], "a.pdf")
+        self.assertEqual(data["importance_rank"], 1)
+        self.assertEqual(data["_score"], 0.5)
 
 
 if __name__ == "__main__":